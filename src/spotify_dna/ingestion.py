@@ -3,13 +3,47 @@ import glob
 from pathlib import Path
 import pandas as pd
 
-def load_streaming_history(data_dir: Path) -> pd.DataFrame:
+# content kinds found in Spotify exports, in classification priority order
+CONTENT_TYPES = ('track', 'episode', 'audiobook')
+
+# column whose presence identifies each content kind
+_TYPE_KEY_COLUMNS = {
+    'track': 'master_metadata_track_name',
+    'episode': 'episode_name',
+    'audiobook': 'audiobook_title',
+}
+
+# columns that only carry meaning for one content kind
+_TYPE_COLUMNS = {
+    'track': [
+        'master_metadata_track_name',
+        'master_metadata_album_artist_name',
+        'master_metadata_album_album_name',
+        'spotify_track_uri',
+    ],
+    'episode': [
+        'episode_name',
+        'episode_show_name',
+        'spotify_episode_uri',
+    ],
+    'audiobook': [
+        'audiobook_title',
+        'audiobook_uri',
+        'audiobook_chapter_uri',
+        'audiobook_chapter_title',
+    ],
+}
+
+_BOOL_COLUMNS = ['shuffle', 'skipped', 'offline', 'incognito_mode']
+
+def load_streaming_store(data_dir: Path) -> pd.DataFrame:
     """
-    Load all Streaming_History_Audio_*.json files from data_dir,
-    concatenate into a DataFrame, parse timestamps,
-    and filter only audio entries.
+    Load every Streaming_History_*.json file (audio and video) from data_dir
+    into a single DataFrame, parse timestamps, cast flag columns to nullable
+    booleans and tag each row with a categorical 'content_type'
+    ('track', 'episode' or 'audiobook'; NaN when none applies).
     """
-    files = glob.glob(str(data_dir / "Streaming_History_Audio_*.json"))
+    files = sorted(glob.glob(str(data_dir / "Streaming_History_*.json")))
     dfs = []
     for file in files:
         with open(file, 'r', encoding='utf-8') as f:
@@ -23,6 +57,42 @@ def load_streaming_history(data_dir: Path) -> pd.DataFrame:
     full = pd.concat(dfs, ignore_index=True)
     # parse timestamp as datetime with UTC tz
     full['ts'] = pd.to_datetime(full['ts'], utc=True)
-    # keep only rows where a track name exists
-    audio_df = full[full['master_metadata_track_name'].notna()].reset_index(drop=True)
-    return audio_df
+    for col in _BOOL_COLUMNS:
+        if col in full.columns:
+            full[col] = full[col].astype('boolean')
+
+    # classify rows; earlier kinds in CONTENT_TYPES win, so apply them last
+    content_type = pd.Series(None, index=full.index, dtype='object')
+    for kind in reversed(CONTENT_TYPES):
+        key = _TYPE_KEY_COLUMNS[kind]
+        if key in full.columns:
+            content_type = content_type.mask(full[key].notna(), kind)
+    full['content_type'] = pd.Categorical(content_type, categories=CONTENT_TYPES)
+    return full
+
+def select_content(store: pd.DataFrame, content_type: str) -> pd.DataFrame:
+    """
+    Project the store onto a single content type: keep only its rows and
+    drop the columns specific to the other content types.
+    """
+    if content_type not in CONTENT_TYPES:
+        raise ValueError(
+            f"Unknown content type '{content_type}'; expected one of {CONTENT_TYPES}."
+        )
+    if store.empty:
+        return pd.DataFrame()
+
+    other_cols = {
+        col
+        for kind, cols in _TYPE_COLUMNS.items() if kind != content_type
+        for col in cols
+    }
+    keep_cols = [col for col in store.columns if col not in other_cols]
+    rows = store['content_type'] == content_type
+    return store.loc[rows, keep_cols].reset_index(drop=True)
+
+def load_streaming_history(data_dir: Path) -> pd.DataFrame:
+    """
+    Load the streaming store from data_dir and return only track plays.
+    """
+    return select_content(load_streaming_store(data_dir), 'track')
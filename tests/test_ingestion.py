@@ -4,7 +4,11 @@ from pathlib import Path
 import pytest
 from pandas import DatetimeTZDtype
 
-from src.spotify_dna.ingestion import load_streaming_history
+from src.spotify_dna.ingestion import (
+    load_streaming_history,
+    load_streaming_store,
+    select_content,
+)
 
 # two records: one with master_metadata_track_name, one without
 SAMPLE_RECORDS = [
@@ -86,3 +90,63 @@ def test_load_streaming_history(tmp_path):
 
     # verify the one remaining track name
     assert df.loc[0, 'master_metadata_track_name'] == "Song A"
+
+EPISODE_RECORD = {
+    "ts": "2024-12-02T08:41:17Z",
+    "platform": "android",
+    "ms_played": 709762,
+    "conn_country": "IL",
+    "ip_addr": "0.0.0.0",
+    "master_metadata_track_name": None,
+    "master_metadata_album_artist_name": None,
+    "master_metadata_album_album_name": None,
+    "spotify_track_uri": None,
+    "episode_name": "Episode A",
+    "episode_show_name": "Show A",
+    "spotify_episode_uri": "uri:episode:A",
+    "audiobook_title": None,
+    "audiobook_uri": None,
+    "audiobook_chapter_uri": None,
+    "audiobook_chapter_title": None,
+    "reason_start": "clickrow",
+    "reason_end": "endplay",
+    "shuffle": False,
+    "skipped": True,
+    "offline": None,
+    "offline_timestamp": None,
+    "incognito_mode": False
+}
+
+@pytest.fixture
+def mixed_dir(tmp_path):
+    with open(tmp_path / "Streaming_History_Audio_test.json", 'w', encoding='utf-8') as f:
+        json.dump(SAMPLE_RECORDS, f)
+    with open(tmp_path / "Streaming_History_Video_test.json", 'w', encoding='utf-8') as f:
+        json.dump([EPISODE_RECORD], f)
+    return tmp_path
+
+def test_load_streaming_store(mixed_dir):
+    store = load_streaming_store(mixed_dir)
+
+    # all rows from both export kinds are kept
+    assert len(store) == 3
+    assert isinstance(store['content_type'].dtype, pd.CategoricalDtype)
+    assert store['content_type'].value_counts()['track'] == 1
+    assert store['content_type'].value_counts()['episode'] == 1
+    assert store['content_type'].isna().sum() == 1
+    assert store['skipped'].dtype == 'boolean'
+
+def test_select_content(mixed_dir):
+    store = load_streaming_store(mixed_dir)
+
+    episodes = select_content(store, 'episode')
+    assert len(episodes) == 1
+    assert episodes.loc[0, 'episode_show_name'] == "Show A"
+    assert 'master_metadata_track_name' not in episodes.columns
+
+    tracks = select_content(store, 'track')
+    assert list(tracks['master_metadata_track_name']) == ["Song A"]
+    assert 'episode_name' not in tracks.columns
+
+    with pytest.raises(ValueError):
+        select_content(store, 'video')